@@ -7,6 +7,7 @@ import os
 import sys
 import logging
 import json
+import re
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 
@@ -20,6 +21,18 @@ from ui.helper import make_scrollable
 import csv
 import io
 import zipfile
+import functools
+import hashlib
+import shutil
+import string
+import tempfile
+import threading
+from collections import OrderedDict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import managers
 from core.managers import (
@@ -56,12 +69,284 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Export files are written through a 1 MiB buffer instead of the 8 KiB default
+EXPORT_WRITE_BUFFER = 1 << 20
+
+# Formats written for each report when "All Formats" is selected
+ALL_EXPORT_FORMATS = ("pdf", "excel", "json")
+
+# Export tab styles, set once on ExportWidget so they override the
+# MainWindow theme stylesheet and are parsed once per widget tree
+EXPORT_STYLESHEET = """
+    /* template dialogs */
+    QLabel#TemplatePreviewLabel {
+        padding: 10px;
+        background-color: #f8f9fa;
+        border: 1px solid #dee2e6;
+        border-radius: 5px;
+        min-height: 60px;
+    }
+
+    /* EOWR left panel */
+    QLabel#EOWRContentsHeader {
+        color: #2c3e50;
+    }
+
+    QTreeWidget#EOWRSectionsTree {
+        border: 1px solid #bdc3c7;
+        border-radius: 5px;
+        padding: 5px;
+    }
+    QTreeWidget#EOWRSectionsTree::item {
+        padding: 8px;
+        border-bottom: 1px solid #eee;
+    }
+    QTreeWidget#EOWRSectionsTree::item:selected {
+        background-color: #e3f2fd;
+        color: #1565c0;
+    }
+    QTreeWidget#EOWRSectionsTree::item:hover {
+        background-color: #f5f5f5;
+    }
+
+    QGroupBox#EOWRSelectionInfo {
+        font-size: 10pt;
+        border: 1px solid #7f8c8d;
+        border-radius: 5px;
+    }
+
+    /* EOWR right panel */
+    QGroupBox#EOWRWellGroup {
+        font-size: 11pt;
+        font-weight: bold;
+        border: 2px solid #2ecc71;
+        border-radius: 5px;
+    }
+
+    QGroupBox#EOWRFormatGroup {
+        font-size: 11pt;
+        border: 1px solid #FF9800;
+        border-radius: 5px;
+    }
+
+    QGroupBox#EOWRSettingsGroup {
+        font-size: 11pt;
+        border: 1px solid #9C27B0;
+        border-radius: 5px;
+    }
+
+    QPushButton#EOWRGenerateButton {
+        background-color: #3498db;
+        color: white;
+        border-radius: 5px;
+        padding: 10px;
+    }
+    QPushButton#EOWRGenerateButton:hover {
+        background-color: #2980b9;
+    }
+    QPushButton#EOWRGenerateButton:pressed {
+        background-color: #21618c;
+    }
+"""
+
+# Daily export preview HTML, parsed once at import
+_PREVIEW_HEADER_TPL = string.Template("""
+        <h2>📊 Daily Export Preview</h2>
+        <hr>
+        <h3>🎯 Well Information</h3>
+        <p><b>Well:</b> $well</p>
+        <p><b>Date Range:</b> $from_date to $to_date</p>
+        <hr>
+        <h3>📄 Selected Reports</h3>
+        <ul>
+        """)
+
+_PREVIEW_FOOTER_TPL = string.Template("""
+        </ul>
+        <hr>
+        <h3>📁 Export Settings</h3>
+        <p><b>Format:</b> $format</p>
+        <p><b>Include Charts:</b> $charts</p>
+        <p><b>Include Summary:</b> $summary</p>
+        <hr>
+        <p style='color: #666; font-style: italic;'>
+        This is a preview. Actual export will generate complete reports with all data.
+        </p>
+        """)
+
+
+def open_export_folder(path: str) -> bool:
+    """Open an export folder in the system file manager without blocking the GUI"""
+    try:
+        return QDesktopServices.openUrl(QUrl.fromLocalFile(os.path.abspath(path)))
+    except Exception as e:
+        logger.error(f"Error opening folder: {e}")
+        return False
+
+
+def report_file_prefix(well_name: str, report_type: str) -> str:
+    """File name prefix for one report, safe to use in a file name"""
+    return re.sub(r"[^\w\-]+", "_", f"{well_name}_{report_type}")
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by export workers, delivered on the GUI thread"""
+    done = Signal(str, str)  # report_type, file_path
+    error = Signal(str, str)  # report_type, message
+
+
+class ExportWorker(QRunnable):
+    """Renders a single report on a QThreadPool thread"""
+    
+    def __init__(self, export_func, report_type: str, *args):
+        super().__init__()
+        self.export_func = export_func
+        self.report_type = report_type
+        self.args = args
+        self.signals = WorkerSignals()
+    
+    def run(self):
+        try:
+            file_path = self.export_func(*self.args)
+            self.signals.done.emit(self.report_type, file_path or "")
+        except Exception as e:
+            logger.error(f"Error exporting {self.report_type}: {e}", exc_info=True)
+            self.signals.error.emit(self.report_type, str(e))
+
+
+# ==================== Export File Cache ====================
+class ExportFileCache:
+    """LRU cache of generated report files, keyed by report inputs"""
+    
+    SETTINGS_KEY = "export/file_cache_index"
+    
+    def __init__(self, cache_dir: str = None, max_bytes: int = 500 * 1024 * 1024):
+        self.cache_dir = cache_dir or os.path.join(tempfile.gettempdir(), "drillmaster_export_cache")
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, ...], str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._loaded = False
+    
+    @staticmethod
+    def hash_data(data: Any) -> str:
+        """Stable hash of report data, serialized with orjson when available"""
+        payload = None
+        if orjson is not None:
+            try:
+                payload = orjson.dumps(
+                    data, default=str,
+                    option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+                )
+            except TypeError:
+                payload = None
+        if payload is None:
+            payload = json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    @staticmethod
+    def make_key(well_name: str, report_type: str, export_format: str,
+                 data_hash: str) -> Tuple[str, ...]:
+        """Build a cache key from the report inputs and the hash of its data"""
+        return (well_name, report_type, export_format, data_hash)
+    
+    def copy_to(self, key: Tuple[str, ...], output_dir: str, file_prefix: str) -> Optional[str]:
+        """
+        Copy the cached file for key into output_dir and return the copy, or None.
+        The copy is named {file_prefix}_{timestamp} like the ExportGenerator
+        writers, and runs under the lock so a concurrent eviction cannot remove it.
+        """
+        with self._lock:
+            self._load_index()
+            cached_path = self._entries.get(key)
+            if cached_path is None:
+                return None
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            extension = os.path.splitext(cached_path)[1]
+            file_path = os.path.join(output_dir, f"{file_prefix}_{timestamp}{extension}")
+            try:
+                os.makedirs(output_dir, exist_ok=True)
+                shutil.copy(cached_path, file_path)
+            except OSError as e:
+                logger.warning(f"Dropping unreadable export cache entry {cached_path}: {e}")
+                del self._entries[key]
+                self._save_index()
+                return None
+            self._entries.move_to_end(key)
+            return file_path
+    
+    def put(self, key: Tuple[str, ...], file_path: str):
+        """Store a copy of a freshly generated file under key"""
+        if not file_path or not os.path.exists(file_path):
+            return
+        
+        with self._lock:
+            self._load_index()
+            entry_dir = os.path.join(
+                self.cache_dir,
+                hashlib.blake2b("|".join(key).encode("utf-8"), digest_size=8).hexdigest()
+            )
+            
+            # Only the extension is reused, copy_to gives each hit a fresh timestamp
+            cached_path = os.path.join(entry_dir, os.path.basename(file_path))
+            try:
+                os.makedirs(entry_dir, exist_ok=True)
+                shutil.copy2(file_path, cached_path)
+            except OSError as e:
+                logger.warning(f"Could not cache export {file_path}: {e}")
+                return
+            
+            self._entries[key] = cached_path
+            self._entries.move_to_end(key)
+            self._evict()
+            self._save_index()
+    
+    def _evict(self):
+        """Drop least recently used files until the cache fits in max_bytes"""
+        sizes = {
+            key: os.path.getsize(path) if os.path.exists(path) else 0
+            for key, path in self._entries.items()
+        }
+        total = sum(sizes.values())
+        
+        while total > self.max_bytes and len(self._entries) > 1:
+            key, path = self._entries.popitem(last=False)
+            total -= sizes[key]
+            shutil.rmtree(os.path.dirname(path), ignore_errors=True)
+    
+    def _load_index(self):
+        """Restore the cache index saved by a previous run"""
+        if self._loaded:
+            return
+        self._loaded = True
+        
+        try:
+            raw = QSettings("Nikan", "DrillMaster").value(self.SETTINGS_KEY, "")
+            for key, path in json.loads(raw or "[]"):
+                if os.path.exists(path):
+                    self._entries[tuple(key)] = path
+        except Exception as e:
+            logger.warning(f"Could not restore export cache index: {e}")
+    
+    def _save_index(self):
+        """Persist the cache index so it survives restarts"""
+        try:
+            index = [[list(key), path] for key, path in self._entries.items()]
+            QSettings("Nikan", "DrillMaster").setValue(self.SETTINGS_KEY, json.dumps(index))
+        except Exception as e:
+            logger.warning(f"Could not save export cache index: {e}")
+
+
+export_file_cache = ExportFileCache()
+
 
 # ==================== Daily Export Tab ====================
 @make_scrollable
 class DailyExportTab(QWidget):
     """Daily Export Tab - For generating daily reports"""
     
+    template_type = "daily"
+    reportExported = Signal(str, str)  # report_type, file_path
+    
     def __init__(self, db_manager: DatabaseManager = None):
         super().__init__()
         self.db = db_manager
@@ -83,6 +368,16 @@ class DailyExportTab(QWidget):
         self.current_well = None
         self.current_reports = []
         
+        # State of the running export, see _export_next
+        self._export_state = {}
+        self._pending = []
+        self.exported_files_model = QStringListModel()
+        self._preview_cache: Dict[tuple, str] = {}
+        self._default_row: Optional[int] = None
+        self._well_id_to_index: Dict[int, int] = {}
+        self._preview_dialog: Optional[QDialog] = None
+        self._schedule_dialog: Optional[QDialog] = None
+        
         self.init_ui()
         self.setup_connections()
         self.load_data()
@@ -208,6 +503,7 @@ class DailyExportTab(QWidget):
         reports_layout.setSpacing(10)
         
         self.report_checkboxes = []
+        self._selected_reports = set()
         reports = [
             ("Well Info", "📋 Well Information", "Basic well details and location"),
             ("Daily Report", "📅 Daily Drilling Report", "Daily operations summary"),
@@ -232,8 +528,10 @@ class DailyExportTab(QWidget):
             cb.setChecked(True)
             cb.setToolTip(tooltip)
             cb.setFont(QFont("Arial", 9))
+            cb.toggled.connect(functools.partial(self._on_report_toggled, report_name))
             
             self.report_checkboxes.append((report_name, cb))
+            self._selected_reports.add(report_name)
             reports_layout.addWidget(cb, row, col)
             
             col += 1
@@ -344,6 +642,11 @@ class DailyExportTab(QWidget):
             lambda state: self.password_field.setEnabled(state == Qt.Checked)
         )
         
+        self.show_folder_after_export = QCheckBox("📂 Open folder after export")
+        self.show_folder_after_export.setChecked(True)
+        self.show_folder_after_export.setFont(QFont("Arial", 9))
+        layout.addWidget(self.show_folder_after_export, 3, 0, 1, 2)
+        
         group.setLayout(layout)
         return group
     
@@ -450,6 +753,13 @@ class DailyExportTab(QWidget):
         self.preview_btn.clicked.connect(self.preview_export)
         self.schedule_btn.clicked.connect(self.schedule_export)
         self.save_template_btn.clicked.connect(self.save_template)
+        self.reportExported.connect(self.on_report_file_ready)
+        
+        # Preview inputs
+        for _, checkbox in self.report_checkboxes:
+            checkbox.stateChanged.connect(self.invalidate_preview_cache)
+        self.from_date.dateChanged.connect(self.invalidate_preview_cache)
+        self.to_date.dateChanged.connect(self.invalidate_preview_cache)
     
     def load_data(self):
         """Load data from database"""
@@ -459,6 +769,7 @@ class DailyExportTab(QWidget):
         """Refresh wells list from database"""
         try:
             self.well_combo.clear()
+            self._well_id_to_index = {}
             logger.info("Clearing wells combo box")
             
             if self.db:
@@ -474,7 +785,7 @@ class DailyExportTab(QWidget):
                         
                         if well_id is not None:
                             # استفاده از یک روش ثابت
-                            self.well_combo.addItem(well_name, userData=well_id)
+                            self._add_well_item(well_name, well_id)
                         else:
                             logger.warning(f"Well ID is None for well: {well_name}")
                 
@@ -487,15 +798,15 @@ class DailyExportTab(QWidget):
                         {"id": 3, "name": "Test Well 2"}
                     ]
                     for well in sample_wells:
-                        self.well_combo.addItem(well['name'], userData=well['id'])
+                        self._add_well_item(well['name'], well['id'])
                         logger.info(f"Added sample well: {well['name']}")
             
             else:
                 logger.error("Database manager is None!")
                 # داده‌های نمونه
-                self.well_combo.addItem("Test Well A", userData=1)
-                self.well_combo.addItem("Test Well B", userData=2)
-                self.well_combo.addItem("Test Well C", userData=3)
+                self._add_well_item("Test Well A", 1)
+                self._add_well_item("Test Well B", 2)
+                self._add_well_item("Test Well C", 3)
             
             if self.well_combo.count() > 0:
                 self.well_combo.setCurrentIndex(0)
@@ -509,6 +820,11 @@ class DailyExportTab(QWidget):
             logger.error(f"Error refreshing wells list: {e}", exc_info=True)
             self.status_manager.show_error("DailyExportTab", f"Error loading wells: {str(e)}")
             
+    def _add_well_item(self, well_name: str, well_id: int):
+        """Add a well to the combo box and index it by ID"""
+        self.well_combo.addItem(well_name, userData=well_id)
+        self._well_id_to_index[well_id] = self.well_combo.count() - 1
+    
     def select_all_reports(self):
         """Select all reports"""
         for _, checkbox in self.report_checkboxes:
@@ -519,18 +835,23 @@ class DailyExportTab(QWidget):
         for _, checkbox in self.report_checkboxes:
             checkbox.setChecked(False)
     
+    def _on_report_toggled(self, report_name: str, checked: bool):
+        """Keep the live set of selected reports in step with the checkboxes"""
+        if checked:
+            self._selected_reports.add(report_name)
+        else:
+            self._selected_reports.discard(report_name)
+    
     def get_selected_reports(self) -> List[str]:
         """
         Returns list of selected report identifiers
         Example: ["Well Info", "Daily Report", "Mud Report"]
         """
-        selected_reports = []
-
-        for report_key, checkbox in self.report_checkboxes:
-            if checkbox.isChecked():
-                selected_reports.append(report_key)
-
-        return selected_reports
+        # Checkbox order, without querying every checkbox through Qt
+        return [
+            report_key for report_key, _ in self.report_checkboxes
+            if report_key in self._selected_reports
+        ]
  
     def get_export_format(self) -> str:
         """Get selected export format"""
@@ -664,7 +985,6 @@ class DailyExportTab(QWidget):
             self.progress_bar.setValue(0)
             self.status_label.setText(f"🔄 Preparing {export_format.upper()} export for {well_name}...")
             self.details_text.clear()
-            QApplication.processEvents()
             
             # بررسی وجود DatabaseManager
             if not self.db:
@@ -686,94 +1006,178 @@ class DailyExportTab(QWidget):
             os.makedirs(output_dir, exist_ok=True)
             logger.info(f"Output directory: {output_dir}")
             
-            total_reports = len(selected_reports)
-            exported_files = []
+            formats = ALL_EXPORT_FORMATS if export_format == "all" else (export_format,)
             
-            for i, report_type in enumerate(selected_reports):
-                progress = int((i + 1) / total_reports * 100)
-                self.progress_bar.setValue(progress)
-                
-                logger.info(f"Processing report: {report_type}")
-                self.details_text.append(f"📄 Exporting {report_type} as {export_format.upper()}...")
-                QApplication.processEvents()
-                
-                try:
-                    file_path = ""
-                    
-                    # بر اساس نوع گزارش و فرمت، export مناسب را فراخوانی کنید
-                    if report_type == "Well Info":
-                        well_data = data_collector.get_well_info(well_id)
-                        if well_data:
-                            file_path = self.get_export_format(
-                                export_generator, well_data, well_name, report_type, 
-                                export_format, output_dir
-                            )
-                    
-                    elif report_type == "Daily Report":
-                        reports_data = data_collector.get_daily_reports_for_export(
-                            well_id, from_date_py, to_date_py
-                        )
-                        if reports_data:
-                            file_path = self.get_export_format(
-                                export_generator, reports_data, well_name, report_type, 
-                                export_format, output_dir
-                            )
-                    
-                    elif report_type == "Drilling Parameters":
-                        drilling_data = data_collector.get_drilling_parameters_for_export(
-                            well_id, from_date_py, to_date_py
-                        )
-                        if drilling_data:
-                            file_path = self.get_export_format(
-                                export_generator, drilling_data, well_name, report_type, 
-                                export_format, output_dir
-                            )
-                    
-                    elif report_type == "Mud Report":
-                        mud_data = data_collector.get_mud_reports_for_export(
-                            well_id, from_date_py, to_date_py
-                        )
-                        if mud_data:
-                            file_path = self.get_export_format(
-                                export_generator, mud_data, well_name, report_type, 
-                                export_format, output_dir
-                            )
-                    
-                    elif report_type == "Safety":
-                        safety_data = {
-                            "safety_reports": data_collector.get_safety_reports_for_export(
-                                well_id, from_date_py, to_date_py
-                            ),
-                            "bop_components": data_collector.get_bop_components_for_export(well_id),
-                            "waste_records": data_collector.get_waste_records_for_export(
-                                well_id, from_date_py, to_date_py
-                            )
-                        }
-                        if any(safety_data.values()):
-                            file_path = self.get_export_format(
-                                export_generator, safety_data, well_name, report_type, 
-                                export_format, output_dir
-                            )
-                    
-                    # بقیه گزارش‌ها...
-                    
-                    if file_path:
-                        exported_files.append(file_path)
-                        self.details_text.append(f"   ✓ Saved to: {os.path.basename(file_path)}")
-                        logger.info(f"File saved: {file_path}")
-                    else:
-                        self.details_text.append(f"   ⚠️ No data available")
-                    
-                except Exception as e:
-                    logger.error(f"Error exporting {report_type}: {e}", exc_info=True)
-                    self.details_text.append(f"   ❌ Error: {str(e)[:50]}")
-                
-                QApplication.processEvents()
-                import time
-                time.sleep(0.1)
+            self._export_state = {
+                "export_generator": export_generator,
+                "data_collector": data_collector,
+                "well_id": well_id,
+                "well_name": well_name,
+                "from_date": from_date_py,
+                "to_date": to_date_py,
+                "export_format": export_format,
+                "output_dir": output_dir,
+                "formats": formats,
+                "total": len(selected_reports) * len(formats),
+                "remaining": len(selected_reports) * len(formats),
+            }
+            self._pending = list(selected_reports)
+            self.exported_files_model.setStringList([])
             
-            self.progress_bar.setValue(100)
+            # One report is collected per event-loop turn, see _export_next
+            self.export_btn.setEnabled(False)
+            QTimer.singleShot(0, self._export_next)
             
+        except Exception as e:
+            logger.error(f"Error in generate_export: {e}", exc_info=True)
+            QMessageBox.critical(self, "Error", f"Export failed: {str(e)}")
+            self.status_label.setText("❌ Export failed")
+            self.export_btn.setEnabled(True)
+    
+    def _export_next(self):
+        """Collect data for the next pending report and hand it to a worker"""
+        if not self._pending:
+            return
+        
+        state = self._export_state
+        formats = state["formats"]
+        report_type = self._pending.pop(0)
+        handled = 0  # files of this report already counted or handed to a worker
+        
+        try:
+            logger.info(f"Processing report: {report_type}")
+            
+            # Data is collected on the GUI thread - the database session is shared
+            try:
+                report_data = self.collect_report_data(
+                    state["data_collector"], report_type, state["well_id"],
+                    state["from_date"], state["to_date"]
+                )
+            except Exception as e:
+                logger.error(f"Error collecting {report_type}: {e}", exc_info=True)
+                self.details_text.append(f"   ❌ {report_type}: {str(e)[:50]}")
+                handled = len(formats)
+                self._report_handled(len(formats))
+            else:
+                if report_data:
+                    self.details_text.append(
+                        f"📄 Exporting {report_type} as {state['export_format'].upper()}..."
+                    )
+                    # Hashed once here and shared by the workers of every format
+                    data_hash = ExportFileCache.hash_data(report_data)
+                    for export_format in formats:
+                        worker = ExportWorker(
+                            self.export_single_report, report_type,
+                            state["export_generator"], report_data, state["well_name"],
+                            report_type, export_format, state["output_dir"], data_hash
+                        )
+                        worker.signals.done.connect(self.on_report_exported)
+                        worker.signals.error.connect(self.on_report_failed)
+                        QThreadPool.globalInstance().start(worker)
+                        handled += 1
+                else:
+                    self.details_text.append(f"   ⚠️ {report_type}: No data available")
+                    handled = len(formats)
+                    self._report_handled(len(formats))
+        except Exception as e:
+            logger.error(f"Error in generate_export: {e}", exc_info=True)
+            QMessageBox.critical(self, "Error", f"Export failed: {str(e)}")
+            self.status_label.setText("❌ Export failed")
+            
+            # Count everything not handed to a worker as handled, so the run
+            # still finishes and re-enables the Export button
+            skipped = len(formats) * (len(self._pending) + 1) - handled
+            self._pending = []
+            if skipped:
+                self._report_handled(skipped)
+            return
+        
+        if self._pending:
+            QTimer.singleShot(0, self._export_next)
+    
+    def collect_report_data(self, data_collector, report_type: str, well_id: int,
+                            from_date_py: date, to_date_py: date) -> Any:
+        """Collect the data backing a single report type"""
+        if report_type == "Well Info":
+            return data_collector.get_well_info(well_id)
+        
+        if report_type == "Daily Report":
+            return data_collector.get_daily_reports_for_export(
+                well_id, from_date_py, to_date_py
+            )
+        
+        if report_type == "Drilling Parameters":
+            return data_collector.get_drilling_parameters_for_export(
+                well_id, from_date_py, to_date_py
+            )
+        
+        if report_type == "Mud Report":
+            return data_collector.get_mud_reports_for_export(
+                well_id, from_date_py, to_date_py
+            )
+        
+        if report_type == "Safety":
+            safety_data = {
+                "safety_reports": data_collector.get_safety_reports_for_export(
+                    well_id, from_date_py, to_date_py
+                ),
+                "bop_components": data_collector.get_bop_components_for_export(well_id),
+                "waste_records": data_collector.get_waste_records_for_export(
+                    well_id, from_date_py, to_date_py
+                )
+            }
+            return safety_data if any(safety_data.values()) else None
+        
+        # بقیه گزارش‌ها...
+        return None
+    
+    def on_report_failed(self, report_type: str, message: str):
+        """Handle a report whose generation raised an error"""
+        self.on_report_exported(report_type, "", message)
+    
+    def on_report_exported(self, report_type: str, file_path: str, error: str = ""):
+        """Record the outcome of one report file and finish once all are handled"""
+        if error:
+            logger.error(f"Error exporting {report_type}: {error}")
+            self.details_text.append(f"   ❌ {report_type}: {error[:50]}")
+        elif file_path:
+            logger.info(f"File saved: {file_path}")
+            self.reportExported.emit(report_type, file_path)
+        else:
+            self.details_text.append(f"   ⚠️ {report_type}: No data available")
+        
+        self._report_handled()
+    
+    def _report_handled(self, count: int = 1):
+        """Advance progress by count report files and finish once all are handled"""
+        state = self._export_state
+        state["remaining"] -= count
+        done = state["total"] - state["remaining"]
+        self.progress_bar.setValue(int(done / state["total"] * 100))
+        
+        if state["remaining"] == 0:
+            self._finish_export()
+    
+    def on_report_file_ready(self, report_type: str, file_path: str):
+        """Show a finished report as soon as its file is written"""
+        self.details_text.append(f"   ✓ Saved to: {os.path.basename(file_path)}")
+        
+        row = self.exported_files_model.rowCount()
+        self.exported_files_model.insertRows(row, 1)
+        self.exported_files_model.setData(self.exported_files_model.index(row), file_path)
+    
+    def _finish_export(self):
+        """Show export results once every report has been handled"""
+        state = self._export_state
+        well_name = state["well_name"]
+        export_format = state["export_format"]
+        output_dir = state["output_dir"]
+        exported_files = self.exported_files_model.stringList()
+        
+        self.progress_bar.setValue(100)
+        self.export_btn.setEnabled(True)
+        
+        try:
             # نمایش نتایج
             if exported_files:
                 self.status_label.setText(f"✅ {export_format.upper()} export completed for {well_name}!")
@@ -783,14 +1187,16 @@ class DailyExportTab(QWidget):
                 
                 Well: {well_name}
                 Format: {export_format.upper()}
-                Reports: {len(exported_files)}/{len(selected_reports)}
+                Reports: {len(exported_files)}/{state["total"]}
                 Location: {output_dir}/
                 
                 Files created:
                 """
                 
-                for i, file_path in enumerate(exported_files):
-                    message += f"\n{i+1}. {os.path.basename(file_path)}"
+                message += "".join(
+                    f"\n{i+1}. {os.path.basename(file_path)}"
+                    for i, file_path in enumerate(exported_files)
+                )
                 
                 QMessageBox.information(
                     self,
@@ -808,14 +1214,29 @@ class DailyExportTab(QWidget):
                     "Export Warning",
                     "No files were exported. Check if data exists for selected reports."
                 )
-            
+        
         except Exception as e:
-            logger.error(f"Error in generate_export: {e}", exc_info=True)
-            QMessageBox.critical(self, "Error", f"Export failed: {str(e)}")
+            logger.error(f"Error finishing export: {e}", exc_info=True)
             self.status_label.setText("❌ Export failed")
             
     def preview_export(self):
         """Preview the export"""
+        # Reuse the HTML rendered for identical inputs
+        key = self.preview_cache_key()
+        content = self._preview_cache.get(key)
+        if content is None:
+            content = self.build_preview_html()
+            self._preview_cache[key] = content
+        
+        # The dialog is built on first use and reused afterwards
+        if self._preview_dialog is None:
+            self._preview_dialog = self._build_preview_dialog()
+        
+        self._preview_dialog.preview_text.setHtml(content)
+        self._preview_dialog.exec_()
+    
+    def _build_preview_dialog(self) -> QDialog:
+        """Create the preview dialog once"""
         dialog = QDialog(self)
         dialog.setWindowTitle("📊 Daily Export Preview")
         dialog.setMinimumSize(700, 500)
@@ -823,59 +1244,65 @@ class DailyExportTab(QWidget):
         layout = QVBoxLayout()
         
         # Preview content
-        preview_text = QTextEdit()
-        preview_text.setReadOnly(True)
+        dialog.preview_text = QTextEdit()
+        dialog.preview_text.setReadOnly(True)
+        layout.addWidget(dialog.preview_text)
         
-        # Build preview
-        content = """
-        <h2>📊 Daily Export Preview</h2>
-        <hr>
-        <h3>🎯 Well Information</h3>
-        <p><b>Well:</b> {well}</p>
-        <p><b>Date Range:</b> {from_date} to {to_date}</p>
-        <hr>
-        <h3>📄 Selected Reports</h3>
-        <ul>
-        """.format(
+        # Close button
+        close_btn = QPushButton("Close Preview")
+        close_btn.clicked.connect(dialog.close)
+        layout.addWidget(close_btn)
+        
+        dialog.setLayout(layout)
+        return dialog
+    
+    def preview_cache_key(self) -> tuple:
+        """Inputs that determine the preview HTML"""
+        return (
+            self.well_combo.currentText(),
+            self.from_date.date().toJulianDay(),
+            self.to_date.date().toJulianDay(),
+            tuple(self.get_selected_reports()),
+            self.get_export_format(),
+            self.include_charts.isChecked(),
+            self.include_summary.isChecked(),
+        )
+    
+    def invalidate_preview_cache(self):
+        """Drop cached preview HTML after an input changed"""
+        self._preview_cache.clear()
+    
+    def build_preview_html(self) -> str:
+        """Build the preview HTML for the current selection"""
+        header = _PREVIEW_HEADER_TPL.substitute(
             well=self.well_combo.currentText(),
             from_date=self.from_date.date().toString('yyyy-MM-dd'),
             to_date=self.to_date.date().toString('yyyy-MM-dd')
         )
         
-        for report_name, checkbox in self.report_checkboxes:
-            if checkbox.isChecked():
-                content += f"<li>✓ {report_name}</li>"
+        items = "".join(
+            f"<li>✓ {report_name}</li>"
+            for report_name in self.get_selected_reports()
+        )
         
-        content += """
-        </ul>
-        <hr>
-        <h3>📁 Export Settings</h3>
-        <p><b>Format:</b> {format}</p>
-        <p><b>Include Charts:</b> {charts}</p>
-        <p><b>Include Summary:</b> {summary}</p>
-        <hr>
-        <p style='color: #666; font-style: italic;'>
-        This is a preview. Actual export will generate complete reports with all data.
-        </p>
-        """.format(
+        footer = _PREVIEW_FOOTER_TPL.substitute(
             format=self.get_export_format().upper(),
             charts='Yes' if self.include_charts.isChecked() else 'No',
             summary='Yes' if self.include_summary.isChecked() else 'No'
         )
         
-        preview_text.setHtml(content)
-        layout.addWidget(preview_text)
-        
-        # Close button
-        close_btn = QPushButton("Close Preview")
-        close_btn.clicked.connect(dialog.close)
-        layout.addWidget(close_btn)
-        
-        dialog.setLayout(layout)
-        dialog.exec_()
+        return header + items + footer
     
     def schedule_export(self):
         """Schedule daily export"""
+        # The dialog is built on first use and reused afterwards
+        if self._schedule_dialog is None:
+            self._schedule_dialog = self._build_schedule_dialog()
+        
+        self._schedule_dialog.exec_()
+    
+    def _build_schedule_dialog(self) -> QDialog:
+        """Create the schedule dialog once"""
         dialog = QDialog(self)
         dialog.setWindowTitle("⏰ Schedule Daily Export")
         dialog.setFixedSize(400, 300)
@@ -933,9 +1360,46 @@ class DailyExportTab(QWidget):
         cancel_btn.clicked.connect(dialog.close)
         
         dialog.setLayout(layout)
-        dialog.exec_()
+        return dialog
+    
+    def _open_export_folder(self, output_dir: str):
+        """Open the export folder if the user asked for it"""
+        if self.show_folder_after_export.isChecked():
+            open_export_folder(output_dir)
     
     def export_single_report(
+        self,
+        export_generator,
+        well_data: dict,
+        well_name: str,
+        report_type: str,
+        export_format: str,
+        output_dir: str,
+        well_data_hash: Optional[str] = None
+    ) -> str:
+        """
+        Export a single report using selected generator.
+        Identical inputs are served from the export file cache; pass
+        well_data_hash to reuse a hash already computed for well_data.
+        """
+        if well_data_hash is None:
+            well_data_hash = ExportFileCache.hash_data(well_data)
+        
+        cache_key = ExportFileCache.make_key(well_name, report_type, export_format, well_data_hash)
+        cached_path = export_file_cache.copy_to(
+            cache_key, output_dir, report_file_prefix(well_name, report_type)
+        )
+        if cached_path:
+            logger.info(f"Export cache hit for {report_type} ({export_format})")
+            return cached_path
+        
+        file_path = self.render_single_report(
+            export_generator, well_data, well_name, report_type, export_format, output_dir
+        )
+        export_file_cache.put(cache_key, file_path)
+        return file_path
+    
+    def render_single_report(
         self,
         export_generator,
         well_data: dict,
@@ -945,40 +1409,35 @@ class DailyExportTab(QWidget):
         output_dir: str
     ) -> str:
         """
-        Export a single report using selected generator
+        Render a single report document with the selected generator.
+        The prefix is unique per report so concurrent workers never share
+        a timestamped file name; the file is then moved into output_dir.
         """
-
-        if export_format == "word":
-            return export_generator.export_word(
-                well_data=well_data,
-                well_name=well_name,
-                report_type=report_type,
-                output_dir=output_dir
-            )
-
+        file_prefix = report_file_prefix(well_name, report_type)
+        
         if export_format == "pdf":
-            return export_generator.export_pdf(
-                well_data=well_data,
-                well_name=well_name,
-                report_type=report_type,
-                output_dir=output_dir
-            )
-
-        raise ValueError(f"Unsupported export format: {export_format}")
+            file_path = export_generator._export_to_pdf(well_data, file_prefix)
+        elif export_format == "word":
+            file_path = export_generator._export_to_json(well_data, file_prefix)  # Temp
+        elif export_format == "excel":
+            file_path = export_generator._export_to_excel(well_data, file_prefix)
+        elif export_format == "json":
+            file_path = export_generator._export_to_json(well_data, file_prefix)
+        else:
+            raise ValueError(f"Unsupported export format: {export_format}")
+        
+        if not file_path:
+            raise RuntimeError(f"Failed to write {export_format.upper()} file")
+        
+        os.makedirs(output_dir, exist_ok=True)
+        return shutil.move(file_path, os.path.join(output_dir, os.path.basename(file_path)))
 
 
     def save_template(self):
         """Save template to database"""
         try:
             # تشخیص نوع تب
-            if isinstance(self, DailyExportTab):
-                template_type = "daily"
-            elif isinstance(self, EOWRExportTab):
-                template_type = "eowr"
-            elif isinstance(self, BatchExportTab):
-                template_type = "batch"
-            else:
-                template_type = "general"
+            template_type = self.template_type
             
             template_data = {
                 "name": f"{template_type.upper()} Template - {datetime.now().strftime('%Y%m%d_%H%M%S')}",
@@ -1016,6 +1475,8 @@ class DailyExportTab(QWidget):
                                       "No saved daily export templates found.")
                 return
             
+            templates_by_id = {t['id']: t for t in templates}
+            
             # Create dialog
             dialog = QDialog(self)
             dialog.setWindowTitle("📂 Load Daily Export Template")
@@ -1023,35 +1484,38 @@ class DailyExportTab(QWidget):
             
             layout = QVBoxLayout()
             
-            # Template list
+            # Template list - populated with updates and signals paused
             template_list = QListWidget()
-            for template in templates:
-                item = QListWidgetItem(f"📄 {template['name']}")
-                item.setData(Qt.UserRole, template['id'])
-                item.setToolTip(template.get('description', 'No description'))
-                
-                # Mark default template
-                if template.get('is_default'):
-                    item.setText(f"⭐ {template['name']} (Default)")
-                    item.setForeground(QColor("#FF9900"))
-                
-                template_list.addItem(item)
+            template_list.setUpdatesEnabled(False)
+            template_list.blockSignals(True)
+            try:
+                for template in templates:
+                    item = QListWidgetItem(f"📄 {template['name']}")
+                    item.setData(Qt.UserRole, template['id'])
+                    item.setToolTip(template.get('description', 'No description'))
+                    
+                    # Mark default template
+                    if template.get('is_default'):
+                        item.setText(f"⭐ {template['name']} (Default)")
+                        item.setForeground(QColor("#FF9900"))
+                    
+                    template_list.addItem(item)
+            finally:
+                template_list.blockSignals(False)
+                template_list.setUpdatesEnabled(True)
+            
+            # Row of the starred template, so set-default touches only two items
+            self._default_row = next(
+                (i for i, t in enumerate(templates) if t.get('is_default')), None
+            )
             
             layout.addWidget(QLabel("Select template to load:"))
             layout.addWidget(template_list)
             
             # Preview area
             preview_label = QLabel("Template preview will appear here...")
+            preview_label.setObjectName("TemplatePreviewLabel")
             preview_label.setWordWrap(True)
-            preview_label.setStyleSheet("""
-                QLabel {
-                    padding: 10px;
-                    background-color: #f8f9fa;
-                    border: 1px solid #dee2e6;
-                    border-radius: 5px;
-                    min-height: 60px;
-                }
-            """)
             layout.addWidget(preview_label)
             
             # Update preview when selection changes
@@ -1059,7 +1523,7 @@ class DailyExportTab(QWidget):
                 selected = template_list.currentItem()
                 if selected:
                     template_id = selected.data(Qt.UserRole)
-                    template_data = next((t for t in templates if t['id'] == template_id), None)
+                    template_data = templates_by_id.get(template_id)
                     if template_data:
                         preview = f"""
                         <b>{template_data['name']}</b><br>
@@ -1108,27 +1572,24 @@ class DailyExportTab(QWidget):
                     return
                 
                 template_id = selected.data(Qt.UserRole)
-                template_data = next((t for t in templates if t['id'] == template_id), None)
+                template_data = templates_by_id.get(template_id)
                 if template_data:
                     reply = QMessageBox.question(dialog, "Set as Default", 
                                                f"Set '{template_data['name']}' as default template?",
                                                QMessageBox.Yes | QMessageBox.No)
                     if reply == QMessageBox.Yes:
                         if self.db.set_default_template(template_id, "daily"):
-                            # Update UI
-                            for i in range(template_list.count()):
-                                item = template_list.item(i)
-                                item_id = item.data(Qt.UserRole)
-                                if item_id == template_id:
-                                    item.setText(f"⭐ {template_data['name']} (Default)")
-                                    item.setForeground(QColor("#FF9900"))
-                                else:
-                                    # Remove star from other items
-                                    text = item.text()
-                                    if text.startswith("⭐ "):
-                                        text = text.replace("⭐ ", "").replace(" (Default)", "")
-                                        item.setText(text)
-                                        item.setForeground(QColor("#000000"))
+                            # Update UI - remove star from the previous default only
+                            if self._default_row is not None:
+                                old_item = template_list.item(self._default_row)
+                                old_data = templates_by_id.get(old_item.data(Qt.UserRole)) if old_item else None
+                                if old_data:
+                                    old_item.setText(f"📄 {old_data['name']}")
+                                    old_item.setForeground(QColor("#000000"))
+                            
+                            selected.setText(f"⭐ {template_data['name']} (Default)")
+                            selected.setForeground(QColor("#FF9900"))
+                            self._default_row = template_list.row(selected)
                             
                             self.status_manager.show_success("DailyExportTab", 
                                                            f"'{template_data['name']}' set as default")
@@ -1140,14 +1601,23 @@ class DailyExportTab(QWidget):
                     return
                 
                 template_id = selected.data(Qt.UserRole)
-                template_data = next((t for t in templates if t['id'] == template_id), None)
+                template_data = templates_by_id.get(template_id)
                 if template_data:
                     reply = QMessageBox.question(dialog, "Confirm Delete", 
                                                f"Are you sure you want to delete '{template_data['name']}'?",
                                                QMessageBox.Yes | QMessageBox.No)
                     if reply == QMessageBox.Yes:
                         if self.db.delete_export_template(template_id):
-                            template_list.takeItem(template_list.row(selected))
+                            row = template_list.row(selected)
+                            template_list.takeItem(row)
+                            
+                            # Keep the default row in step with the list
+                            if self._default_row is not None:
+                                if row == self._default_row:
+                                    self._default_row = None
+                                elif row < self._default_row:
+                                    self._default_row -= 1
+                            
                             self.status_manager.show_success("DailyExportTab", "Template deleted")
                             
                             # Update preview
@@ -1200,13 +1670,12 @@ class DailyExportTab(QWidget):
                 well_id = well_selection.get('well_id')
                 if well_id:
                     # Find and select the well in combo box
-                    for i in range(self.well_combo.count()):
-                        if self.well_combo.itemData(i) == well_id:
-                            self.well_combo.setCurrentIndex(i)
-                            break
+                    index = self._well_id_to_index.get(well_id)
+                    if index is not None:
+                        self.well_combo.setCurrentIndex(index)
             
             # Apply report selection
-            report_selection = template_data.get('report_selection', [])
+            report_selection = set(template_data.get('report_selection') or [])
             for report_name, checkbox in self.report_checkboxes:
                 checkbox.setChecked(report_name in report_selection)
             
@@ -1261,6 +1730,8 @@ class DailyExportTab(QWidget):
 class EOWRExportTab(QWidget):
     """End of Well Report Export Tab"""
     
+    template_type = "eowr"
+    
     def __init__(self, db_manager: DatabaseManager = None):
         super().__init__()
         self.db = db_manager
@@ -1337,32 +1808,15 @@ class EOWRExportTab(QWidget):
         
         # Header
         header = QLabel("📋 Report Contents")
+        header.setObjectName("EOWRContentsHeader")
         header.setFont(QFont("Arial", 12, QFont.Bold))
-        header.setStyleSheet("color: #2c3e50;")
         layout.addWidget(header)
         
         # Tree widget for sections
         self.sections_tree = QTreeWidget()
         self.sections_tree.setHeaderLabel("📁 Report Sections")
+        self.sections_tree.setObjectName("EOWRSectionsTree")
         self.sections_tree.setFont(QFont("Arial", 10))
-        self.sections_tree.setStyleSheet("""
-            QTreeWidget {
-                border: 1px solid #bdc3c7;
-                border-radius: 5px;
-                padding: 5px;
-            }
-            QTreeWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #eee;
-            }
-            QTreeWidget::item:selected {
-                background-color: #e3f2fd;
-                color: #1565c0;
-            }
-            QTreeWidget::item:hover {
-                background-color: #f5f5f5;
-            }
-        """)
         
         self.setup_report_sections()
         layout.addWidget(self.sections_tree)
@@ -1384,13 +1838,7 @@ class EOWRExportTab(QWidget):
         
         # Selection info
         info_group = QGroupBox("ℹ️ Selection Info")
-        info_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 10pt;
-                border: 1px solid #7f8c8d;
-                border-radius: 5px;
-            }
-        """)
+        info_group.setObjectName("EOWRSelectionInfo")
         
         info_layout = QVBoxLayout()
         self.selection_summary = QLabel("No sections selected")
@@ -1411,14 +1859,7 @@ class EOWRExportTab(QWidget):
         
         # Well information
         well_group = QGroupBox("🎯 Well Information")
-        well_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 11pt;
-                font-weight: bold;
-                border: 2px solid #2ecc71;
-                border-radius: 5px;
-            }
-        """)
+        well_group.setObjectName("EOWRWellGroup")
         
         well_layout = QFormLayout()
         well_layout.setSpacing(10)
@@ -1445,13 +1886,7 @@ class EOWRExportTab(QWidget):
         
         # Format selection
         format_group = QGroupBox("📁 Export Format")
-        format_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 11pt;
-                border: 1px solid #FF9800;
-                border-radius: 5px;
-            }
-        """)
+        format_group.setObjectName("EOWRFormatGroup")
         
         format_layout = QVBoxLayout()
         format_layout.setSpacing(10)
@@ -1474,13 +1909,7 @@ class EOWRExportTab(QWidget):
         
         # Settings
         settings_group = QGroupBox("⚙️ Report Settings")
-        settings_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 11pt;
-                border: 1px solid #9C27B0;
-                border-radius: 5px;
-            }
-        """)
+        settings_group.setObjectName("EOWRSettingsGroup")
         
         settings_layout = QGridLayout()
         settings_layout.setSpacing(10)
@@ -1543,22 +1972,9 @@ class EOWRExportTab(QWidget):
         
         # Generate button
         self.generate_btn = QPushButton("🚀 Generate Full EOWR Report")
+        self.generate_btn.setObjectName("EOWRGenerateButton")
         self.generate_btn.setMinimumHeight(50)
         self.generate_btn.setFont(QFont("Arial", 12, QFont.Bold))
-        self.generate_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border-radius: 5px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #21618c;
-            }
-        """)
         layout.addWidget(self.generate_btn)
         
         # Additional buttons
@@ -1662,15 +2078,23 @@ class EOWRExportTab(QWidget):
             ]
         }
 
+        # Tree order and live set of checked sections, see on_section_changed
+        self._section_order = []
+        self._selected_sections = set()
+
         for parent, children in sections.items():
             parent_item = QTreeWidgetItem(self.sections_tree, [parent])
             parent_item.setCheckState(0, Qt.Checked)
             parent_item.setFont(0, QFont("Arial", 10, QFont.Bold))
+            self._section_order.append(parent)
 
             for child in children:
                 child_item = QTreeWidgetItem(parent_item, [child])
                 child_item.setCheckState(0, Qt.Checked)
                 child_item.setFont(0, QFont("Arial", 9))
+                self._section_order.append(child)
+
+        self._selected_sections.update(self._section_order)
 
         self.sections_tree.expandAll()
         self.update_selection_count()
@@ -1679,6 +2103,7 @@ class EOWRExportTab(QWidget):
         """Setup signal connections"""
         self.browse_logo_btn.clicked.connect(self.browse_logo)
         self.preview_logo_btn.clicked.connect(self.preview_logo)
+        self.sections_tree.itemChanged.connect(self.on_section_changed)
         self.sections_tree.itemChanged.connect(self.update_selection_count)
         self.sections_tree.itemChanged.connect(self.update_selection_summary)
         self.generate_btn.clicked.connect(self.generate_report)
@@ -1761,20 +2186,16 @@ class EOWRExportTab(QWidget):
                 child = item.child(j)
                 child.setCheckState(0, check_state)
             
+    def on_section_changed(self, item: QTreeWidgetItem, column: int = 0):
+        """Keep the live set of checked sections in step with the tree"""
+        if item.checkState(0) == Qt.Checked:
+            self._selected_sections.add(item.text(0))
+        else:
+            self._selected_sections.discard(item.text(0))
+    
     def update_selection_count(self):
         """Update count of selected sections"""
-        count = 0
-        root = self.sections_tree.invisibleRootItem()
-        
-        def count_selected(item):
-            nonlocal count
-            if item.checkState(0) == Qt.Checked:
-                count += 1
-            for i in range(item.childCount()):
-                count_selected(item.child(i))
-        
-        for i in range(root.childCount()):
-            count_selected(root.child(i))
+        count = len(self._selected_sections)
         
         if hasattr(self, 'count_label'): 
             self.count_label.setText(f"Selected: {count} sections")
@@ -1806,20 +2227,11 @@ class EOWRExportTab(QWidget):
     
     def get_selected_sections(self) -> List[str]:
         """Get list of selected sections"""
-        selected = []
-        root = self.sections_tree.invisibleRootItem()
-
-        def traverse(item):
-            if item.checkState(0) == Qt.Checked:
-                text = item.text(0)
-                selected.append(text)  # متن کامل را برمی‌گردانیم
-            for i in range(item.childCount()):
-                traverse(item.child(i))
-
-        for i in range(root.childCount()):
-            traverse(root.child(i))
-
-        return selected
+        # متن کامل را برمی‌گردانیم - in tree order, without walking the tree
+        return [
+            section for section in self._section_order
+            if section in self._selected_sections
+        ]
     
     def get_export_format(self) -> str:
         """Get selected export format"""
@@ -2235,14 +2647,7 @@ class EOWRExportTab(QWidget):
         """Save template to database"""
         try:
             # تشخیص نوع تب
-            if isinstance(self, DailyExportTab):
-                template_type = "daily"
-            elif isinstance(self, EOWRExportTab):
-                template_type = "eowr"
-            elif isinstance(self, BatchExportTab):
-                template_type = "batch"
-            else:
-                template_type = "general"
+            template_type = self.template_type
             
             template_data = {
                 "name": f"{template_type.upper()} Template - {datetime.now().strftime('%Y%m%d_%H%M%S')}",
@@ -2322,6 +2727,8 @@ class EOWRExportTab(QWidget):
 class BatchExportTab(QWidget):
     """Batch Export Tab - For multiple wells and reports"""
     
+    template_type = "batch"
+    
     def __init__(self, db_manager: DatabaseManager = None):
         super().__init__()
         self.db = db_manager
@@ -3085,7 +3492,6 @@ class BatchExportTab(QWidget):
                         self.details_text.append(f"    ✗ No data available for export")
                     
                     QApplication.processEvents()
-                    QThread.msleep(100)  # Small delay for UI update
                 
                 except Exception as e:
                     failed_exports += 1
@@ -3191,19 +3597,8 @@ class BatchExportTab(QWidget):
             )
         
         # Open output folder
-        if self.show_folder_after_export.isChecked():  # نیاز به اضافه کردن checkbox جدید
-            try:
-                import subprocess
-                import platform
-                
-                if platform.system() == "Windows":
-                    os.startfile(output_path)
-                elif platform.system() == "Darwin":  # macOS
-                    subprocess.run(["open", output_path])
-                else:  # Linux
-                    subprocess.run(["xdg-open", output_path])
-            except Exception as e:
-                logger.error(f"Error opening folder: {e}")
+        if self.show_folder_after_export.isChecked():
+            open_export_folder(output_path)
                 
     def query_database_data(self, well_id: Any, report_type: str, 
                            from_date: str, to_date: str) -> Dict[str, Any]:
@@ -3383,14 +3778,7 @@ class BatchExportTab(QWidget):
         """Save template to database"""
         try:
             # تشخیص نوع تب
-            if isinstance(self, DailyExportTab):
-                template_type = "daily"
-            elif isinstance(self, EOWRExportTab):
-                template_type = "eowr"
-            elif isinstance(self, BatchExportTab):
-                template_type = "batch"
-            else:
-                template_type = "general"
+            template_type = self.template_type
             
             template_data = {
                 "name": f"{template_type.upper()} Template - {datetime.now().strftime('%Y%m%d_%H%M%S')}",
@@ -5093,7 +5481,7 @@ class ExportGenerator:
             # Create exports directory if it doesn't exist
             os.makedirs("exports", exist_ok=True)
             
-            with open(filename, 'w', encoding='utf-8') as f:
+            with open(filename, 'w', encoding='utf-8', buffering=EXPORT_WRITE_BUFFER) as f:
                 json.dump(data, f, indent=2, default=str, ensure_ascii=False)
             
             return filename
@@ -5116,7 +5504,7 @@ class ExportGenerator:
             
             # For now, just save as JSON and rename
             # In production, implement actual Excel export using pandas
-            with open(filename, 'w', encoding='utf-8') as f:
+            with open(filename, 'w', encoding='utf-8', buffering=EXPORT_WRITE_BUFFER) as f:
                 json.dump(data, f, indent=2, default=str, ensure_ascii=False)
             
             # Rename to .xlsx (this is temporary)
@@ -5141,7 +5529,7 @@ class ExportGenerator:
             # This would use a PDF library like ReportLab or WeasyPrint
             # For now, create a simple placeholder
             
-            with open(filename, 'w', encoding='utf-8') as f:
+            with open(filename, 'w', encoding='utf-8', buffering=EXPORT_WRITE_BUFFER) as f:
                 f.write(f"PDF Export of {file_prefix}\n")
                 f.write(f"Generated: {datetime.now()}\n\n")
                 f.write("Data summary:\n")
@@ -5170,7 +5558,7 @@ class ExportGenerator:
             
             if isinstance(data, list) and len(data) > 0:
                 # If it's a list of dictionaries, write as CSV
-                with open(filename, 'w', newline='', encoding='utf-8') as f:
+                with open(filename, 'w', newline='', encoding='utf-8', buffering=EXPORT_WRITE_BUFFER) as f:
                     if data and isinstance(data[0], dict):
                         fieldnames = data[0].keys()
                         writer = csv.DictWriter(f, fieldnames=fieldnames)
@@ -5183,13 +5571,13 @@ class ExportGenerator:
                             writer.writerow([str(item)])
             elif isinstance(data, dict):
                 # If it's a dictionary, flatten it
-                with open(filename, 'w', newline='', encoding='utf-8') as f:
+                with open(filename, 'w', newline='', encoding='utf-8', buffering=EXPORT_WRITE_BUFFER) as f:
                     writer = csv.writer(f)
                     for key, value in data.items():
                         writer.writerow([key, str(value)])
             else:
                 # For other types
-                with open(filename, 'w', encoding='utf-8') as f:
+                with open(filename, 'w', encoding='utf-8', buffering=EXPORT_WRITE_BUFFER) as f:
                     f.write(str(data))
             
             return filename
@@ -5207,7 +5595,8 @@ class ExportGenerator:
             # Create exports directory if it doesn't exist
             os.makedirs("exports", exist_ok=True)
             
-            with zipfile.ZipFile(zip_filename, 'w') as zipf:
+            with open(zip_filename, 'wb', buffering=EXPORT_WRITE_BUFFER) as zip_file, \
+                    zipfile.ZipFile(zip_file, 'w') as zipf:
                 # Add JSON version
                 json_data = json.dumps(data, indent=2, default=str, ensure_ascii=False)
                 zipf.writestr(f"{file_prefix}.json", json_data)
@@ -5260,6 +5649,7 @@ class ExportWidget(DrillWidgetBase):
         """Initialize the main UI"""
         main_layout = QVBoxLayout(self)
         main_layout.setSpacing(5)
+        self.setStyleSheet(EXPORT_STYLESHEET)
         
         # Create tab widget
         self.tab_widget = QTabWidget()